@@ -1,7 +1,7 @@
 import argparse
+import sys
 
-from .config import load_config
-from .optimize import find_optimal_tuition
+SEPARATOR = "-" * 70
 
 
 def main():
@@ -12,8 +12,20 @@ def main():
     parser.add_argument(
         "-c", "--config", type=str, help="Path to config file (uses default if omitted)"
     )
+    parser.add_argument(
+        "--cache-dir",
+        type=str,
+        help=(
+            "Directory to cache optimization results in (disabled if omitted). "
+            "Entries are loaded with pickle, so use only a trusted directory."
+        ),
+    )
     args = parser.parse_args()
 
+    # Deferred so --help and usage errors don't pay for numpy et al.
+    from .config import load_config
+    from .optimize import find_optimal_tuition
+
     print("\n================= EMBA Tuition Model Simulation =================\n")
 
     try:
@@ -30,24 +42,26 @@ def main():
     print(f"Check range: ${tuition_min:.0f} - ${tuition_max:.0f}")
 
     print("\nRunning...\n")
-    opt = find_optimal_tuition(config, num_years, tuition_min, tuition_max)
+    opt = find_optimal_tuition(
+        config, num_years, tuition_min, tuition_max, cache_dir=args.cache_dir
+    )
     print(f"Optimal tuition: ${opt.best_tuition_per_credit:.0f}/credit")
     print(f"Final year net revenue: ${opt.final_net_revenue:,.2f}")
 
-    print("Year-by-year results:")
-    print("-" * 70)
-    print(
+    lines = [
+        "Year-by-year results:",
+        SEPARATOR,
         f"{'Year':>4} | {'Awareness':>9} | {'Preference':>10} | "
-        f"{'Alumni':>6} | {'Enrolled':>8} | {'Net Revenue':>12}"
-    )
-    print("-" * 70)
-
+        f"{'Alumni':>6} | {'Enrolled':>8} | {'Net Revenue':>12}",
+        SEPARATOR,
+    ]
     for i, r in enumerate(opt.results, start=1):
-        print(
+        lines.append(
             f"{i:>4} | {r.reputation.awareness:>8.2%} | "
             f"{r.reputation.preference:>9.2%} | {r.reputation.alumni_count:>6.0f} | "
             f"{r.students_enrolled:>8} | ${r.net_revenue:>11,.0f}"
         )
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 if __name__ == "__main__":
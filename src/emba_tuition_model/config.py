@@ -1,11 +1,25 @@
+import dataclasses
+import functools
+import hashlib
 import importlib.resources
 import json
-from typing import List
+import math
+import typing
+from dataclasses import dataclass, field
+from typing import Any, Optional, Tuple
 
-from pydantic import BaseModel
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
 
+_DEFAULT_CONFIG_PATH = importlib.resources.files("emba_tuition_model.data").joinpath(
+    "default_config.json"
+)
 
-class InitialState(BaseModel):
+
+@dataclass(frozen=True, slots=True)
+class InitialState:
     """Starting conditions before year 1 begins."""
 
     alumni_count: float
@@ -16,31 +30,36 @@ class InitialState(BaseModel):
     skip_first_spring_summer: bool  # ignoring this launch year
 
 
-class MarketConfig(BaseModel):
+@dataclass(frozen=True, slots=True)
+class MarketConfig:
     size: float  # people who would consider enrolling in an EMBA program
     growth_rate: float
     tuition_low: float
     tuition_high: float
 
 
-class ReputationConfig(BaseModel):
+@dataclass(frozen=True, slots=True)
+class ReputationConfig:
     awareness_decay_rate: float  # fraction lost per year
     preference_decay_rate: float
 
 
-class AlumniConfig(BaseModel):
+@dataclass(frozen=True, slots=True)
+class AlumniConfig:
     candidates_reached_per_year: float  # people each alumnus makes aware
     candidates_influenced_per_year: float  # aware people each alumnus makes prefer
     donation_per_year: float
 
 
-class MarketingConfig(BaseModel):
+@dataclass(frozen=True, slots=True)
+class MarketingConfig:
     spend_pct: float  # fraction of program revenue allocated to marketing
     cost_to_reach_one_candidate: float
     cost_to_influence_one_candidate: float
 
 
-class EnrollmentConfig(BaseModel):
+@dataclass(frozen=True, slots=True)
+class EnrollmentConfig:
     max_students: float
     application_rate: float  # % of potentials that actually attend an emba
     price_sensitivity: float  # higher = more enrollment loss at high prices
@@ -49,49 +68,151 @@ class EnrollmentConfig(BaseModel):
 # --- Education ---
 
 
-class Term(BaseModel):
+@dataclass(frozen=True, slots=True)
+class Term:
     name: str
     has_licensed_content: bool
     has_intensive_lecturer: bool
     has_intensive_experience: bool
 
 
-class Semester(BaseModel):
+@dataclass(frozen=True, slots=True)
+class Semester:
     name: str
-    terms: List[Term]
+    terms: Tuple[Term, ...]
 
 
-class SemesterCosts(BaseModel):
+@dataclass(frozen=True, slots=True)
+class SemesterCosts:
     general_per_student: float
     technology_per_student: float
 
 
-class SemesterFees(BaseModel):
+@dataclass(frozen=True, slots=True)
+class SemesterFees:
     general_per_student: float
     program_per_student: float
     technology_per_student: float
 
 
-class TermCosts(BaseModel):
+@dataclass(frozen=True, slots=True)
+class TermCosts:
     content_per_credit_hour: float
     instructor_per_student: float
     intensive_lecturer: float
     intensive_experience: float
 
 
-class EducationConfig(BaseModel):
+@dataclass(frozen=True, slots=True)
+class PhaseTotals:
+    """
+    One yearly education phase (fall or spring/summer) collapsed to totals per
+    student who starts it. Per-student amounts are weighted by the fraction of
+    students still enrolled when each is charged, so the phase's net revenue is
+    students * (fees + tuition * credits - costs) - fixed_costs.
+    """
+
+    fees_per_student: float
+    credits_per_student: float
+    costs_per_student: float
+    fixed_costs: float  # intensive lecturers/experiences, independent of size
+    retention: float  # fraction of starting students who finish the phase
+
+    def run(self, students_start: Any, cost_per_credit: Any) -> Tuple[Any, Any]:
+        """
+        (net_revenue, students_remaining) for `students_start` students.
+
+        Plain arithmetic, so the arguments may be NumPy arrays as well.
+        """
+        net_per_student = (
+            self.fees_per_student
+            + cost_per_credit * self.credits_per_student
+            - self.costs_per_student
+        )
+        return (
+            students_start * net_per_student - self.fixed_costs,
+            students_start * self.retention,
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class EducationConfig:
     credits_per_term: int
     dropout_rate_per_term: float
     semester_costs: SemesterCosts
     semester_fees: SemesterFees
     term_costs: TermCosts
-    years: List[List[Semester]]  # [0] = fall, [1] = spring/summer
+    years: Tuple[Tuple[Semester, ...], ...]  # [0] = fall, [1] = spring/summer
+
+    # Derived from the fields above once, in __post_init__
+    terms_per_year: int = field(init=False, repr=False)
+    credits_per_year: int = field(init=False, repr=False)
+    semester_fee_per_student: float = field(init=False, repr=False)
+    semester_cost_per_student: float = field(init=False, repr=False)
+    fall_totals: PhaseTotals = field(init=False, repr=False)
+    spring_summer_totals: PhaseTotals = field(init=False, repr=False)
+
+    def __post_init__(self):
+        terms = sum(len(sem.terms) for year in self.years for sem in year)
+        fees = self.semester_fees
+        costs = self.semester_costs
+        object.__setattr__(self, "terms_per_year", terms)
+        object.__setattr__(self, "credits_per_year", terms * self.credits_per_term)
+        object.__setattr__(
+            self,
+            "semester_fee_per_student",
+            fees.program_per_student
+            + fees.general_per_student
+            + fees.technology_per_student,
+        )
+        object.__setattr__(
+            self,
+            "semester_cost_per_student",
+            costs.technology_per_student + costs.general_per_student,
+        )
+        fall = self.years[0] if self.years else ()
+        spring_summer = self.years[1] if len(self.years) > 1 else ()
+        object.__setattr__(self, "fall_totals", self.phase_totals(fall))
+        object.__setattr__(
+            self, "spring_summer_totals", self.phase_totals(spring_summer)
+        )
+
+    def phase_totals(self, semesters: Tuple[Semester, ...]) -> PhaseTotals:
+        """Collapse `semesters` (e.g. one entry of `years`) to PhaseTotals."""
+        tc = self.term_costs
+        keep = 1.0 - self.dropout_rate_per_term
+        enrolled = 1.0  # fraction of starting students still enrolled
+        fees = credits = costs = fixed = 0.0
+
+        for semester in semesters:
+            fees += enrolled * self.semester_fee_per_student
+            costs += enrolled * self.semester_cost_per_student
+
+            for term in semester.terms:
+                credits += enrolled * self.credits_per_term
+                costs += enrolled * tc.instructor_per_student
+                if term.has_licensed_content:
+                    costs += enrolled * tc.content_per_credit_hour
+                if term.has_intensive_lecturer:
+                    fixed += tc.intensive_lecturer
+                if term.has_intensive_experience:
+                    fixed += tc.intensive_experience
+                enrolled *= keep
+
+        return PhaseTotals(
+            fees_per_student=fees,
+            credits_per_student=credits,
+            costs_per_student=costs,
+            fixed_costs=fixed,
+            retention=enrolled,
+        )
 
 
 # --- Full ---
 
 
-class SimulationConfig(BaseModel):
+@dataclass(frozen=True, slots=True)
+class SimulationConfig:
     initial_state: InitialState
     market: MarketConfig
     reputation: ReputationConfig
@@ -100,20 +221,105 @@ class SimulationConfig(BaseModel):
     enrollment: EnrollmentConfig
     education: EducationConfig
 
-
-def load_config(config_path: str = None) -> SimulationConfig:
-    """Load configuration from file path or package defaults."""
+    @classmethod
+    def from_dict(cls, data: dict) -> "SimulationConfig":
+        """Build a config from parsed JSON, e.g. the contents of a config file."""
+        return _build(cls, data, cls.__name__)
+
+
+@functools.lru_cache(maxsize=None)
+def _init_fields(cls: type) -> Tuple[Tuple[str, Any], ...]:
+    """(name, resolved type) of each constructor field, computed once per class."""
+    hints = typing.get_type_hints(cls)
+    return tuple((f.name, hints[f.name]) for f in dataclasses.fields(cls) if f.init)
+
+
+def _build(tp: Any, value: Any, path: str) -> Any:
+    """Recursively convert parsed JSON into the (dataclass) type `tp`."""
+    if dataclasses.is_dataclass(tp):
+        if not isinstance(value, dict):
+            raise ValueError(f"{path}: expected an object, got {value!r}")
+        fields = _init_fields(tp)
+        unknown = value.keys() - {name for name, _ in fields}
+        if unknown:
+            raise ValueError(f"{path}: unknown field(s) {', '.join(sorted(unknown))}")
+        kwargs = {}
+        for name, field_type in fields:
+            if name not in value:
+                raise ValueError(f"{path}.{name}: field required")
+            kwargs[name] = _build(field_type, value[name], f"{path}.{name}")
+        return tp(**kwargs)
+
+    if typing.get_origin(tp) is tuple:
+        if not isinstance(value, list):
+            raise ValueError(f"{path}: expected a list, got {value!r}")
+        item_type = typing.get_args(tp)[0]
+        return tuple(_build(item_type, v, f"{path}[{i}]") for i, v in enumerate(value))
+
+    # Check scalars by hand: the constructors are too forgiving for config
+    # values, e.g. bool("false") is True, int(2.7) is 2 and float(True) is 1.0.
+    # Non-finite numbers are refused too: json.loads accepts NaN and Infinity
+    # literals but orjson doesn't, so a config loading mustn't depend on which
+    # parser is installed.
+    if tp is bool:
+        valid = isinstance(value, bool)
+    elif tp is int or tp is float:
+        valid = isinstance(value, (int, float)) and not isinstance(value, bool)
+        if valid and isinstance(value, float):
+            valid = value.is_integer() if tp is int else math.isfinite(value)
+    elif tp is str:
+        valid = isinstance(value, str)
+    else:
+        valid = True
+    if not valid:
+        raise ValueError(f"{path}: expected {tp.__name__}, got {value!r}")
+    try:
+        return tp(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"{path}: expected {tp.__name__}, got {value!r}") from None
+
+
+def _init_values(value: Any) -> Any:
+    """`value` as plain JSON data, keeping only constructor fields of dataclasses."""
+    if dataclasses.is_dataclass(value):
+        return {
+            name: _init_values(getattr(value, name))
+            for name, _ in _init_fields(type(value))
+        }
+    if isinstance(value, tuple):
+        return [_init_values(v) for v in value]
+    return value
+
+
+def config_hash(config: SimulationConfig) -> str:
+    """
+    Short stable digest of every config value, for keying cached results.
+
+    Only the values a config is built from are hashed, not fields derived from
+    them, so reworking how derived fields are computed doesn't change the hash.
+    """
+    canonical = json.dumps(_init_values(config), sort_keys=True)
+    return hashlib.blake2b(canonical.encode(), digest_size=8).hexdigest()
+
+
+@functools.lru_cache(maxsize=4)
+def load_config(config_path: Optional[str] = None) -> SimulationConfig:
+    """
+    Load configuration from file path or package defaults.
+
+    Configs are immutable, so the parsed result is cached per path; edits to a
+    config file are not picked up until `load_config.cache_clear()`.
+    """
     if config_path:
-        with open(config_path, "r") as f:
-            raw_config = json.load(f)
+        with open(config_path, "rb") as f:
+            data = f.read()
     else:
         try:
-            config_file = importlib.resources.files("emba_tuition_model.data").joinpath(
-                "default_config.json"
-            )
-            with config_file.open("r") as f:
-                raw_config = json.load(f)
-        except (ImportError, AttributeError, FileNotFoundError) as e:
+            data = _DEFAULT_CONFIG_PATH.read_bytes()
+        except FileNotFoundError as e:
             raise RuntimeError(f"Could not load default_config.json: {e}")
 
-    return SimulationConfig(**raw_config)
+    # orjson is an optional, faster drop-in for json.loads
+    raw_config = orjson.loads(data) if orjson is not None else json.loads(data)
+
+    return SimulationConfig.from_dict(raw_config)
@@ -1,51 +1,294 @@
+import hashlib
+import math
+import multiprocessing as mp
+import os
+import pickle
 from dataclasses import dataclass
-from typing import List
+from typing import Callable, List, Optional, Sequence, Tuple
 
-from .config import SimulationConfig
-from .simulation import YearResult, run_model
+import numpy as np
 
+from .batch import run_model_batch
+from .config import SimulationConfig, config_hash
+from .simulation import YearResult, final_net_revenue, run_model
 
-@dataclass
+# Set once per worker process by _init_worker so the config isn't pickled per task.
+_worker_config: Optional[SimulationConfig] = None
+_worker_num_years: int = 0
+_worker_backend: str = "numpy"
+
+GOLDEN_RATIO = (math.sqrt(5) - 1) / 2
+REFINEMENT_FACTOR = 10  # each refinement level samples 10x more finely
+
+# Part of every cache key. Bump it whenever a code change alters simulation
+# results or the pickled result classes, so stale cache entries are ignored.
+_CACHE_VERSION = 2
+
+
+@dataclass(slots=True)
 class OptimizationResult:
     best_tuition_per_credit: float
     final_net_revenue: float
     results: List[YearResult]
 
 
+def _cache_path(cache_dir: str, *key) -> str:
+    key = (_CACHE_VERSION, *key)
+    digest = hashlib.blake2b(repr(key).encode(), digest_size=16).hexdigest()
+    return os.path.join(cache_dir, f"optimum-{digest}.pickle")
+
+
+def _load_cached(path: str) -> Optional[OptimizationResult]:
+    try:
+        with open(path, "rb") as f:
+            result = pickle.load(f)
+    except Exception:
+        # Missing, truncated, or pickled from classes that have since changed
+        # shape (unpickling can raise nearly anything); recompute either way.
+        return None
+    return result if isinstance(result, OptimizationResult) else None
+
+
+def _store_cached(path: str, result: OptimizationResult) -> None:
+    # Best effort, like reading: an unwritable cache mustn't lose the result.
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        cache_dir = os.path.dirname(path)
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+        with open(tmp_path, "wb") as f:
+            pickle.dump(result, f)
+        os.replace(tmp_path, path)  # atomic, so readers never see a partial file
+    except Exception:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+
+def _init_worker(config: SimulationConfig, num_years: int, backend: str) -> None:
+    global _worker_config, _worker_num_years, _worker_backend
+    _worker_config = config
+    _worker_num_years = num_years
+    _worker_backend = backend
+
+
+def _final_net_revenues(
+    tuitions: np.ndarray, num_years: int, config: SimulationConfig, backend: str
+) -> np.ndarray:
+    if backend == "numpy":
+        return run_model_batch(tuitions, num_years, config).net_revenue[-1]
+    if backend == "numba":
+        # Imported here so the default backend doesn't pay numba's import time.
+        from .simulation_numba import final_net_revenues
+
+        return final_net_revenues(tuitions, num_years, config)
+    raise ValueError(f"Unknown simulation backend: {backend!r}")
+
+
+def _evaluate_chunk(tuitions: np.ndarray) -> np.ndarray:
+    """Return final net revenue for each tuition using the worker's config."""
+    return _final_net_revenues(
+        tuitions, _worker_num_years, _worker_config, _worker_backend
+    )
+
+
+def _grid_search(
+    config: SimulationConfig,
+    num_years: int,
+    tuitions: Sequence[float],
+    processes: int,
+    backend: str,
+) -> List[Tuple[float, float]]:
+    """Evaluate every candidate tuition, optionally split over worker processes."""
+    tuitions = np.asarray(tuitions, dtype=np.float64)
+
+    if processes > 1:
+        chunks = np.array_split(tuitions, processes)
+        with mp.Pool(
+            processes, initializer=_init_worker, initargs=(config, num_years, backend)
+        ) as pool:
+            revenues = np.concatenate(pool.map(_evaluate_chunk, chunks))
+    else:
+        revenues = _final_net_revenues(tuitions, num_years, config, backend)
+
+    return list(zip(tuitions.tolist(), revenues.tolist()))
+
+
+def _nested_grid_search(
+    config: SimulationConfig,
+    num_years: int,
+    tuitions: Sequence[float],
+    levels: int,
+    processes: int,
+    backend: str,
+) -> List[Tuple[float, float]]:
+    """
+    Sweep coarsely, then re-sweep more finely around the best candidate.
+
+    Level k (counting down to 0) samples every REFINEMENT_FACTOR**k-th
+    candidate, within one coarse stride either side of the previous level's
+    best. Level 0 is the full-resolution grid, so with levels=1 this is a plain
+    sweep of every candidate.
+    """
+    evaluated = {}
+    lo, hi = 0, len(tuitions) - 1
+    for level in reversed(range(levels)):
+        if lo > hi:
+            break
+        stride = REFINEMENT_FACTOR**level
+        indices = sorted(set(range(lo, hi + 1, stride)) | {hi})
+        results = _grid_search(
+            config, num_years, [tuitions[i] for i in indices], processes, backend
+        )
+        evaluated.update(zip(indices, results))
+        best = max(zip(indices, results), key=lambda item: item[1][1])[0]
+        lo, hi = max(best - stride + 1, 0), min(best + stride - 1, len(tuitions) - 1)
+
+    return [evaluated[i] for i in sorted(evaluated)]
+
+
+def _golden_section_search(
+    evaluate: Callable[[float], float],
+    tuitions: Sequence[float],
+    coarse_points: int = 10,
+) -> List[Tuple[float, float]]:
+    """
+    Locate the best candidate assuming revenue is unimodal in tuition.
+
+    A coarse scan first brackets the peak, then golden-section search narrows
+    the bracket over candidate indices, so results stay on the same grid as a
+    full sweep. Returns the (tuition, final net revenue) pairs it evaluated.
+    """
+    if not tuitions:
+        return []
+    evaluated = {}
+
+    def f(i: int) -> float:
+        if i not in evaluated:
+            evaluated[i] = evaluate(tuitions[i])
+        return evaluated[i]
+
+    last = len(tuitions) - 1
+    coarse = sorted(
+        {round(k * last / (coarse_points - 1)) for k in range(coarse_points)}
+    )
+    best = max(range(len(coarse)), key=lambda k: f(coarse[k]))
+    lo = coarse[max(best - 1, 0)]
+    hi = coarse[min(best + 1, len(coarse) - 1)]
+
+    while hi - lo > 3:
+        width = hi - lo
+        c = hi - round(GOLDEN_RATIO * width)
+        d = lo + round(GOLDEN_RATIO * width)
+        if f(c) >= f(d):
+            hi = d
+        else:
+            lo = c
+    for i in range(lo, hi + 1):
+        f(i)
+
+    return [(tuitions[i], evaluated[i]) for i in sorted(evaluated)]
+
+
 def find_optimal_tuition(
     config: SimulationConfig,
     num_years: int,
     min_annual_tuition: float,
     max_annual_tuition: float,
     step: float = 1,
+    processes: int = 1,
+    method: str = "grid",
+    backend: str = "numpy",
+    refinement_levels: int = 1,
+    cache_dir: Optional[str] = None,
 ) -> OptimizationResult:
-    """Find tuition per credit that maximizes final net revenue after num_years."""
-    terms_per_year = sum(
-        len(sem.terms) for year in config.education.years for sem in year
-    )
-    credits_per_year = terms_per_year * config.education.credits_per_term
+    """
+    Find tuition per credit that maximizes final net revenue after num_years.
+
+    method="grid" simulates every candidate between the bounds `step` apart in
+    one vectorized batch, optionally split over `processes` workers for very
+    large sweeps; backend="numba" runs it as compiled code instead (raises
+    ImportError without the optional numba dependency). With
+    refinement_levels > 1 the grid is swept coarsely first and only refined
+    near the best coarse candidate, which is much cheaper for fine steps but
+    can miss a narrow peak. method="golden" only evaluates a few dozen
+    candidates on the same grid, but assumes revenue rises
+    to a single peak and then falls; it runs them one at a time through the
+    scalar model, so `backend`, `processes` and `refinement_levels` don't apply
+    (they are still validated).
+
+    The model is deterministic, so with `cache_dir` set the result is stored
+    on disk keyed by the config contents, search parameters and
+    _CACHE_VERSION, and repeat calls load it instead of re-running the search.
+    Entries are pickles, so only point `cache_dir` at a trusted directory.
+    """
+    credits_per_year = config.education.credits_per_year
     if credits_per_year == 0:
         raise ValueError("Education config must include at least one term.")
+    if method not in ("grid", "golden"):
+        raise ValueError(f"Unknown search method: {method!r}")
+    if backend not in ("numpy", "numba"):
+        raise ValueError(f"Unknown simulation backend: {backend!r}")
+    if num_years < 1:
+        raise ValueError("num_years must be at least 1.")
+    if step <= 0:
+        raise ValueError(f"step must be positive, got {step!r}")
+    if refinement_levels < 1:
+        raise ValueError("refinement_levels must be at least 1.")
+    if backend == "numba":
+        from .simulation_numba import NUMBA_AVAILABLE
+
+        # Without numba the kernels still run, as plain Python ~60x slower
+        # than the NumPy backend; that fallback is only meant for tests.
+        if not NUMBA_AVAILABLE:
+            raise ImportError('backend="numba" needs numba; install the "jit" extra.')
+
+    cache_path = None
+    if cache_dir is not None:
+        # processes and backend are left out: they don't change the result.
+        cache_path = _cache_path(
+            cache_dir,
+            config_hash(config),
+            num_years,
+            min_annual_tuition,
+            max_annual_tuition,
+            step,
+            method,
+            refinement_levels,
+        )
+        cached = _load_cached(cache_path)
+        if cached is not None:
+            return cached
 
     min_per_credit = min_annual_tuition / credits_per_year
     max_per_credit = max_annual_tuition / credits_per_year
 
-    best_tuition = 0.0
-    best_final_net_rev = -float("inf")
-    best_results = []
-
-    tuition = min_per_credit
-    while tuition <= max_per_credit:
-        results = run_model(tuition, num_years, config)
-        final_net_rev = results[-1].net_revenue
-        if final_net_rev > best_final_net_rev:
-            best_final_net_rev = final_net_rev
-            best_tuition = tuition
-            best_results = results
-        tuition += step
-
-    return OptimizationResult(
+    # Index the grid rather than accumulating `step`, so the endpoint doesn't
+    # depend on float drift; the epsilon absorbs rounding in the division.
+    num_steps = max(0, math.floor((max_per_credit - min_per_credit) / step + 1e-9) + 1)
+    tuitions = [min_per_credit + i * step for i in range(num_steps)]
+
+    if method == "grid":
+        evaluated = _nested_grid_search(
+            config, num_years, tuitions, refinement_levels, processes, backend
+        )
+    else:
+        evaluated = _golden_section_search(
+            lambda t: final_net_revenue(t, num_years, config), tuitions
+        )
+
+    # max() keeps the first of equal revenues, i.e. the lowest such tuition.
+    best_tuition, best_final_net_rev = max(
+        evaluated, key=lambda item: item[1], default=(0.0, -float("inf"))
+    )
+    best_results = run_model(best_tuition, num_years, config) if evaluated else []
+
+    result = OptimizationResult(
         best_tuition_per_credit=best_tuition,
         final_net_revenue=best_final_net_rev,
         results=best_results,
     )
+    if cache_path is not None:
+        _store_cached(cache_path, result)
+    return result
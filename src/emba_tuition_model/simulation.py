@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import List
+from typing import Iterator, List, Sequence, Tuple
 
 from .config import (
     AlumniConfig,
@@ -7,42 +7,43 @@ from .config import (
     EnrollmentConfig,
     MarketConfig,
     MarketingConfig,
+    Semester,
     SimulationConfig,
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class EducationResult:
     net_revenue: float
     students_remaining: float
 
 
-@dataclass
+@dataclass(slots=True)
 class AlumniEffectResult:
     awareness_boost: float
     preference_boost: float
     donations: float
 
 
-@dataclass
+@dataclass(slots=True)
 class MarketingResult:
     awareness_boost: float
     preference_boost: float
 
 
-@dataclass
+@dataclass(slots=True)
 class EnrollmentResult:
     students_enrolled: float
 
 
-@dataclass
+@dataclass(slots=True)
 class Reputation:
     alumni_count: float
     awareness: float  # fraction of market aware (0-1)
     preference: float  # fraction of aware who would choose us (0-1)
 
 
-@dataclass
+@dataclass(slots=True)
 class YearResult:
     fall_marketing_spend: float
     fall_students_remaining: float
@@ -53,41 +54,16 @@ class YearResult:
 
 def education_phase(
     students_start: float,
-    semesters: List,
+    semesters: Sequence[Semester],
     cost_per_credit: float,
     config: EducationConfig,
 ) -> EducationResult:
-    """Calculate income, expense, and remaining students for a set of semesters."""
-    income = 0.0
-    expense = 0.0
-    students = students_start
-
-    for semester in semesters:
-        income += students * (
-            config.semester_fees.program_per_student
-            + config.semester_fees.general_per_student
-            + config.semester_fees.technology_per_student
-        )
-        expense += students * (
-            config.semester_costs.technology_per_student
-            + config.semester_costs.general_per_student
-        )
-
-        for term in semester.terms:
-            income += students * cost_per_credit * config.credits_per_term
-
-            tc = config.term_costs
-            expense += students * tc.instructor_per_student
-            if term.has_licensed_content:
-                expense += students * tc.content_per_credit_hour
-            if term.has_intensive_lecturer:
-                expense += tc.intensive_lecturer
-            if term.has_intensive_experience:
-                expense += tc.intensive_experience
-
-            students *= 1.0 - config.dropout_rate_per_term
-
-    return EducationResult(net_revenue=income - expense, students_remaining=students)
+    """Calculate net revenue and remaining students for a set of semesters."""
+    totals = config.phase_totals(tuple(semesters))
+    net_revenue, students_remaining = totals.run(students_start, cost_per_credit)
+    return EducationResult(
+        net_revenue=net_revenue, students_remaining=students_remaining
+    )
 
 
 def alumni_phase(
@@ -150,6 +126,17 @@ def marketing_phase(
     )
 
 
+def _price_position(total_tuition_cost: float, market_config: MarketConfig) -> float:
+    """Price position in market (0 = cheapest, 1 = most expensive)."""
+    tuition_range = market_config.tuition_high - market_config.tuition_low
+    if tuition_range > 0:
+        price_position = (
+            total_tuition_cost - market_config.tuition_low
+        ) / tuition_range
+        return max(0.0, min(1.0, price_position))
+    return 0.0
+
+
 def enrollment_phase(
     reputation: Reputation,
     total_tuition_cost: float,
@@ -160,19 +147,10 @@ def enrollment_phase(
     Enrollment funnel: aware -> preference -> price-adjusted -> apply -> enroll.
     High preference protects against price sensitivity.
     """
+    price_position = _price_position(total_tuition_cost, market_config)
     aware_population = market_config.size * reputation.awareness
     base_choice_rate = reputation.preference
 
-    # Price position in market (0 = cheapest, 1 = most expensive)
-    tuition_range = market_config.tuition_high - market_config.tuition_low
-    if tuition_range > 0:
-        price_position = (
-            total_tuition_cost - market_config.tuition_low
-        ) / tuition_range
-        price_position = max(0.0, min(1.0, price_position))
-    else:
-        price_position = 0.0
-
     # High preference reduces price sensitivity
     effective_sensitivity = enrollment_config.price_sensitivity * (1 - base_choice_rate)
     price_factor = max(0.0, 1 - effective_sensitivity * price_position)
@@ -180,9 +158,50 @@ def enrollment_phase(
     effective_choice_rate = base_choice_rate * price_factor
     would_choose = aware_population * effective_choice_rate
     applicants = would_choose * enrollment_config.application_rate
-    enrolled = min(applicants, enrollment_config.max_students)
+    return EnrollmentResult(
+        students_enrolled=min(applicants, enrollment_config.max_students)
+    )
+
+
+# A year's results as a plain tuple, in YearResult field order with the
+# reputation flattened: (fall_marketing_spend, fall_students_remaining,
+# students_enrolled, net_revenue, alumni_count, awareness, preference).
+# The year loop passes these along and only builds YearResults on request.
+_YearState = Tuple[float, float, int, float, float, float, float]
+
 
-    return EnrollmentResult(students_enrolled=enrolled)
+def _year_state(result: YearResult) -> _YearState:
+    reputation = result.reputation
+    return (
+        result.fall_marketing_spend,
+        result.fall_students_remaining,
+        result.students_enrolled,
+        result.net_revenue,
+        reputation.alumni_count,
+        reputation.awareness,
+        reputation.preference,
+    )
+
+
+def _year_result(state: _YearState) -> YearResult:
+    (
+        fall_marketing_spend,
+        fall_students_remaining,
+        students_enrolled,
+        net_revenue,
+        alumni_count,
+        awareness,
+        preference,
+    ) = state
+    # Positional arguments: run_model builds one of these per year, and keyword
+    # arguments make dataclass construction about twice as slow.
+    return YearResult(
+        fall_marketing_spend,
+        fall_students_remaining,
+        students_enrolled,
+        net_revenue,
+        Reputation(alumni_count, awareness, preference),
+    )
 
 
 def run_year(
@@ -192,115 +211,194 @@ def run_year(
     config: SimulationConfig,
     skip_spring_summer: bool = False,
 ) -> YearResult:
-    reputation = Reputation(
-        alumni_count=prior_year_result.reputation.alumni_count,
-        awareness=prior_year_result.reputation.awareness,
-        preference=prior_year_result.reputation.preference,
+    price_position = _price_position(total_tuition_cost, config.market)
+    years = _advance_years(
+        _year_state(prior_year_result),
+        cost_per_credit,
+        price_position,
+        config,
+        1,
+        skip_spring_summer,
     )
-    net_revenue = 0.0
+    return _year_result(next(years))
 
-    # Reputation decays without maintenance
-    reputation.awareness *= 1 - config.reputation.awareness_decay_rate
-    reputation.preference *= 1 - config.reputation.preference_decay_rate
 
-    # Spring/Summer education (round students entering education)
-    spring_students = round(prior_year_result.fall_students_remaining)
-    if skip_spring_summer:
-        reputation.alumni_count += spring_students
-        spring_summer_marketing_spend = 0.0
-    else:
-        semesters = config.education.years[1] if len(config.education.years) > 1 else []
-        edu = education_phase(
-            spring_students, semesters, cost_per_credit, config.education
-        )
-        reputation.alumni_count += round(edu.students_remaining)
-        net_revenue += edu.net_revenue
-        spring_summer_marketing_spend = max(
-            0.0, edu.net_revenue * config.marketing.spend_pct
-        )
-        net_revenue -= spring_summer_marketing_spend
-
-    # Alumni effects
-    alumni = alumni_phase(
-        reputation.alumni_count,
-        reputation.awareness,
-        reputation.preference,
-        config.alumni,
-        config.market,
-    )
-    reputation.awareness += alumni.awareness_boost
-    reputation.preference += alumni.preference_boost
-    net_revenue += alumni.donations
+def _advance_years(
+    state: _YearState,
+    cost_per_credit: float,
+    price_position: float,
+    config: SimulationConfig,
+    num_years: int,
+    skip_first_spring_summer: bool,
+) -> Iterator[_YearState]:
+    """
+    Yield the state after each of `num_years` years following `state`.
 
-    # Marketing
-    marketing_spend = (
-        prior_year_result.fall_marketing_spend + spring_summer_marketing_spend
-    )
-    marketing = marketing_phase(
-        marketing_spend,
-        reputation.awareness,
-        reputation.preference,
-        config.marketing,
-        config.market,
+    This is run_year's recurrence with everything fixed for the run (config
+    values, per-student education rates at this tuition, the price position)
+    read into locals once, and the phases inlined so a year is pure arithmetic.
+    max() and min() are written out as conditional expressions for the same
+    reason; each returns exactly what the call would, NaN and -0.0 included.
+    """
+    awareness_keep = 1 - config.reputation.awareness_decay_rate
+    preference_keep = 1 - config.reputation.preference_decay_rate
+    market_size = config.market.size
+    alumni_cfg = config.alumni
+    reached_per_alumnus = alumni_cfg.candidates_reached_per_year
+    influenced_per_alumnus = alumni_cfg.candidates_influenced_per_year
+    donation_per_alumnus = alumni_cfg.donation_per_year
+    marketing_cfg = config.marketing
+    spend_pct = marketing_cfg.spend_pct
+    cost_to_reach = marketing_cfg.cost_to_reach_one_candidate
+    cost_to_influence = marketing_cfg.cost_to_influence_one_candidate
+    enrollment_cfg = config.enrollment
+    price_sensitivity = enrollment_cfg.price_sensitivity
+    application_rate = enrollment_cfg.application_rate
+    max_students = enrollment_cfg.max_students
+
+    # PhaseTotals.run's coefficients, with this run's tuition folded in
+    spring = config.education.spring_summer_totals
+    spring_net_per_student = (
+        spring.fees_per_student
+        + cost_per_credit * spring.credits_per_student
+        - spring.costs_per_student
     )
-    reputation.awareness += marketing.awareness_boost
-    reputation.preference += marketing.preference_boost
-
-    # Enrollment (round students entering education)
-    reputation.awareness = max(0.0, min(1.0, reputation.awareness))
-    reputation.preference = max(0.0, min(1.0, reputation.preference))
-    enrollment = enrollment_phase(
-        reputation, total_tuition_cost, config.enrollment, config.market
+    spring_fixed_costs = spring.fixed_costs
+    spring_retention = spring.retention
+    fall = config.education.fall_totals
+    fall_net_per_student = (
+        fall.fees_per_student
+        + cost_per_credit * fall.credits_per_student
+        - fall.costs_per_student
     )
-    fall_students = round(enrollment.students_enrolled)
+    fall_fixed_costs = fall.fixed_costs
+    fall_retention = fall.retention
+
+    (
+        fall_marketing_spend,
+        fall_students_remaining,
+        _,
+        _,
+        alumni_count,
+        awareness,
+        preference,
+    ) = state
+
+    for year in range(num_years):
+        net_revenue = 0.0
+
+        # Reputation decays without maintenance
+        awareness *= awareness_keep
+        preference *= preference_keep
+
+        # Spring/Summer education (round students entering education)
+        spring_students = round(fall_students_remaining)
+        if year == 0 and skip_first_spring_summer:
+            alumni_count += spring_students
+            spring_summer_marketing_spend = 0.0
+        else:
+            edu_net = spring_students * spring_net_per_student - spring_fixed_costs
+            alumni_count += round(spring_students * spring_retention)
+            net_revenue += edu_net
+            spend = edu_net * spend_pct
+            spring_summer_marketing_spend = spend if spend > 0.0 else 0.0
+
+        # Alumni effects
+        people_reached = alumni_count * reached_per_alumnus
+        awareness_boost = people_reached * (1 - awareness) / market_size
+        aware_population = market_size * awareness
+        if aware_population > 0:
+            people_influenced = alumni_count * influenced_per_alumnus
+            preference += people_influenced * (1 - preference) / aware_population
+        awareness += awareness_boost
+        net_revenue += alumni_count * donation_per_alumnus
+
+        # Marketing
+        marketing_spend = fall_marketing_spend + spring_summer_marketing_spend
+        people_reached = marketing_spend / cost_to_reach
+        awareness_boost = people_reached * (1 - awareness) / market_size
+        aware_population = market_size * awareness
+        if aware_population > 0:
+            people_influenced = marketing_spend / cost_to_influence
+            preference += people_influenced * (1 - preference) / aware_population
+        awareness += awareness_boost
+
+        # Enrollment (round students entering education)
+        awareness = awareness if awareness < 1.0 else 1.0
+        awareness = awareness if awareness > 0.0 else 0.0
+        preference = preference if preference < 1.0 else 1.0
+        preference = preference if preference > 0.0 else 0.0
+        effective_sensitivity = price_sensitivity * (1 - preference)
+        price_factor = 1 - effective_sensitivity * price_position
+        price_factor = price_factor if price_factor > 0.0 else 0.0
+        would_choose = market_size * awareness * (preference * price_factor)
+        applicants = would_choose * application_rate
+        fall_students = round(max_students if max_students < applicants else applicants)
+
+        # Fall education
+        fall_net = fall_students * fall_net_per_student - fall_fixed_costs
+        net_revenue += fall_net
+        spend = fall_net * spend_pct
+        fall_marketing_spend = spend if spend > 0.0 else 0.0
+        net_revenue -= marketing_spend
+        fall_students_remaining = round(fall_students * fall_retention)
+
+        yield (
+            fall_marketing_spend,
+            fall_students_remaining,
+            fall_students,
+            net_revenue,
+            alumni_count,
+            awareness,
+            preference,
+        )
 
-    # Fall education
-    fall_semesters = config.education.years[0] if config.education.years else []
-    fall_edu = education_phase(
-        fall_students, fall_semesters, cost_per_credit, config.education
+
+def _simulate_years(
+    cost_per_credit: float, num_years: int, config: SimulationConfig
+) -> Iterator[_YearState]:
+    initial = config.initial_state
+    state = (
+        initial.prior_fall_marketing_spend,
+        initial.prior_fall_students_remaining,
+        0,
+        0.0,
+        initial.alumni_count,
+        initial.awareness,
+        initial.preference,
     )
-    net_revenue += fall_edu.net_revenue
 
-    fall_marketing_spend = max(0.0, fall_edu.net_revenue * config.marketing.spend_pct)
-    net_revenue -= marketing_spend
+    if config.education.terms_per_year == 0:
+        raise ValueError("Education config must include at least one term.")
+
+    total_tuition = cost_per_credit * config.education.credits_per_year
+    price_position = _price_position(total_tuition, config.market)
 
-    return YearResult(
-        fall_marketing_spend=fall_marketing_spend,
-        fall_students_remaining=round(fall_edu.students_remaining),
-        students_enrolled=fall_students,
-        net_revenue=net_revenue,
-        reputation=reputation,
+    return _advance_years(
+        state,
+        cost_per_credit,
+        price_position,
+        config,
+        num_years,
+        initial.skip_first_spring_summer,
     )
 
 
 def run_model(
     cost_per_credit: float, num_years: int, config: SimulationConfig
 ) -> List[YearResult]:
-    initial = config.initial_state
-    prior = YearResult(
-        fall_marketing_spend=initial.prior_fall_marketing_spend,
-        fall_students_remaining=initial.prior_fall_students_remaining,
-        students_enrolled=0,
-        net_revenue=0.0,
-        reputation=Reputation(
-            alumni_count=initial.alumni_count,
-            awareness=initial.awareness,
-            preference=initial.preference,
-        ),
-    )
-
-    terms_per_year = sum(
-        len(sem.terms) for year in config.education.years for sem in year
-    )
-    if terms_per_year == 0:
-        raise ValueError("Education config must include at least one term.")
-
-    total_tuition = cost_per_credit * config.education.credits_per_term * terms_per_year
+    return [
+        _year_result(state)
+        for state in _simulate_years(cost_per_credit, num_years, config)
+    ]
 
-    results = []
-    for year in range(num_years):
-        skip = (year == 0) and initial.skip_first_spring_summer
-        prior = run_year(prior, cost_per_credit, total_tuition, config, skip)
-        results.append(prior)
 
-    return results
+def final_net_revenue(
+    cost_per_credit: float, num_years: int, config: SimulationConfig
+) -> float:
+    """Final-year net revenue, without keeping every year's results around."""
+    if num_years < 1:
+        raise ValueError("num_years must be at least 1.")
+    for state in _simulate_years(cost_per_credit, num_years, config):
+        pass
+    return state[3]  # net_revenue
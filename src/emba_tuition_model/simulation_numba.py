@@ -0,0 +1,353 @@
+"""
+Optional Numba-compiled version of the simulation recurrence.
+
+numba is an optional dependency (`uv sync --extra jit`). Without it the same
+kernels run as plain Python, which is correct but far slower than the NumPy
+batch; that fallback is for tests only, and find_optimal_tuition refuses
+backend="numba" unless NUMBA_AVAILABLE.
+"""
+
+from typing import List, NamedTuple
+
+import numpy as np
+
+from .batch import BatchResult
+from .config import PhaseTotals, SimulationConfig
+from .simulation import YearResult
+
+try:
+    from numba import njit, prange
+except ImportError:  # pragma: no cover - depends on the environment
+    njit = None
+    prange = range
+
+NUMBA_AVAILABLE = njit is not None
+
+
+def _jit(fn):
+    return njit(cache=True)(fn) if NUMBA_AVAILABLE else fn
+
+
+def _jit_parallel(fn):
+    """Like _jit, but prange loops in `fn` are spread over numba's threads."""
+    return njit(cache=True, parallel=True)(fn) if NUMBA_AVAILABLE else fn
+
+
+class FlatConfig(NamedTuple):
+    """Every scalar the recurrence reads, flattened out of SimulationConfig."""
+
+    awareness0: float
+    preference0: float
+    alumni_count0: float
+    prior_fall_marketing_spend: float
+    prior_fall_students_remaining: float
+    skip_first_spring_summer: bool
+    market_size: float
+    tuition_low: float
+    tuition_high: float
+    awareness_decay_rate: float
+    preference_decay_rate: float
+    candidates_reached_per_year: float
+    candidates_influenced_per_year: float
+    donation_per_year: float
+    spend_pct: float
+    cost_to_reach_one_candidate: float
+    cost_to_influence_one_candidate: float
+    max_students: float
+    application_rate: float
+    price_sensitivity: float
+    credits_per_year: float
+    # PhaseTotals for fall, then spring/summer
+    fall_fees_per_student: float
+    fall_credits_per_student: float
+    fall_costs_per_student: float
+    fall_fixed_costs: float
+    fall_retention: float
+    spring_fees_per_student: float
+    spring_credits_per_student: float
+    spring_costs_per_student: float
+    spring_fixed_costs: float
+    spring_retention: float
+
+
+def flatten_config(config: SimulationConfig) -> FlatConfig:
+    """Flatten config into the FlatConfig the compiled kernels take."""
+    initial = config.initial_state
+    edu = config.education
+
+    def phase(prefix: str, totals: PhaseTotals) -> dict:
+        return {
+            f"{prefix}_fees_per_student": totals.fees_per_student,
+            f"{prefix}_credits_per_student": totals.credits_per_student,
+            f"{prefix}_costs_per_student": totals.costs_per_student,
+            f"{prefix}_fixed_costs": totals.fixed_costs,
+            f"{prefix}_retention": totals.retention,
+        }
+
+    return FlatConfig(
+        awareness0=initial.awareness,
+        preference0=initial.preference,
+        alumni_count0=initial.alumni_count,
+        prior_fall_marketing_spend=initial.prior_fall_marketing_spend,
+        prior_fall_students_remaining=initial.prior_fall_students_remaining,
+        skip_first_spring_summer=initial.skip_first_spring_summer,
+        market_size=config.market.size,
+        tuition_low=config.market.tuition_low,
+        tuition_high=config.market.tuition_high,
+        awareness_decay_rate=config.reputation.awareness_decay_rate,
+        preference_decay_rate=config.reputation.preference_decay_rate,
+        candidates_reached_per_year=config.alumni.candidates_reached_per_year,
+        candidates_influenced_per_year=config.alumni.candidates_influenced_per_year,
+        donation_per_year=config.alumni.donation_per_year,
+        spend_pct=config.marketing.spend_pct,
+        cost_to_reach_one_candidate=config.marketing.cost_to_reach_one_candidate,
+        cost_to_influence_one_candidate=(
+            config.marketing.cost_to_influence_one_candidate
+        ),
+        max_students=config.enrollment.max_students,
+        application_rate=config.enrollment.application_rate,
+        price_sensitivity=config.enrollment.price_sensitivity,
+        credits_per_year=float(edu.credits_per_year),
+        **phase("fall", edu.fall_totals),
+        **phase("spring", edu.spring_summer_totals),
+    )
+
+
+@_jit
+def _education_phase(
+    students, cost_per_credit, fees, credits, costs, fixed_costs, retention
+):
+    net_per_student = fees + cost_per_credit * credits - costs
+    return students * net_per_student - fixed_costs, students * retention
+
+
+@_jit
+def _price_position(cost_per_credit, cfg):
+    total_tuition = cost_per_credit * cfg.credits_per_year
+    tuition_range = cfg.tuition_high - cfg.tuition_low
+    if tuition_range > 0:
+        price_position = (total_tuition - cfg.tuition_low) / tuition_range
+        return max(0.0, min(1.0, price_position))
+    return 0.0
+
+
+@_jit
+def _year(
+    year,
+    fall_marketing_spend,
+    fall_students_remaining,
+    alumni_count,
+    awareness,
+    preference,
+    cost_per_credit,
+    price_position,
+    cfg,
+):
+    """One year of the recurrence; returns the new state in BatchResult order."""
+    net_revenue = 0.0
+    awareness *= 1 - cfg.awareness_decay_rate
+    preference *= 1 - cfg.preference_decay_rate
+
+    # Spring/Summer education
+    spring_students = np.rint(fall_students_remaining)
+    if year == 0 and cfg.skip_first_spring_summer:
+        alumni_count += spring_students
+        spring_summer_marketing_spend = 0.0
+    else:
+        edu_net, edu_remaining = _education_phase(
+            spring_students,
+            cost_per_credit,
+            cfg.spring_fees_per_student,
+            cfg.spring_credits_per_student,
+            cfg.spring_costs_per_student,
+            cfg.spring_fixed_costs,
+            cfg.spring_retention,
+        )
+        alumni_count += np.rint(edu_remaining)
+        net_revenue += edu_net
+        spring_summer_marketing_spend = max(0.0, edu_net * cfg.spend_pct)
+
+    # Alumni effects
+    people_reached = alumni_count * cfg.candidates_reached_per_year
+    awareness_boost = people_reached * (1 - awareness) / cfg.market_size
+    aware_population = cfg.market_size * awareness
+    preference_boost = 0.0
+    if aware_population > 0:
+        people_influenced = alumni_count * cfg.candidates_influenced_per_year
+        preference_boost = people_influenced * (1 - preference) / aware_population
+    awareness += awareness_boost
+    preference += preference_boost
+    net_revenue += alumni_count * cfg.donation_per_year
+
+    # Marketing
+    marketing_spend = fall_marketing_spend + spring_summer_marketing_spend
+    people_reached = marketing_spend / cfg.cost_to_reach_one_candidate
+    awareness_boost = people_reached * (1 - awareness) / cfg.market_size
+    aware_population = cfg.market_size * awareness
+    preference_boost = 0.0
+    if aware_population > 0:
+        people_influenced = marketing_spend / cfg.cost_to_influence_one_candidate
+        preference_boost = people_influenced * (1 - preference) / aware_population
+    awareness += awareness_boost
+    preference += preference_boost
+
+    # Enrollment
+    awareness = max(0.0, min(1.0, awareness))
+    preference = max(0.0, min(1.0, preference))
+    effective_sensitivity = cfg.price_sensitivity * (1 - preference)
+    price_factor = max(0.0, 1 - effective_sensitivity * price_position)
+    would_choose = cfg.market_size * awareness * (preference * price_factor)
+    applicants = would_choose * cfg.application_rate
+    fall_students = np.rint(min(applicants, cfg.max_students))
+
+    # Fall education
+    fall_net, fall_remaining = _education_phase(
+        fall_students,
+        cost_per_credit,
+        cfg.fall_fees_per_student,
+        cfg.fall_credits_per_student,
+        cfg.fall_costs_per_student,
+        cfg.fall_fixed_costs,
+        cfg.fall_retention,
+    )
+    net_revenue += fall_net
+    net_revenue -= marketing_spend
+    fall_marketing_spend = max(0.0, fall_net * cfg.spend_pct)
+    fall_students_remaining = np.rint(fall_remaining)
+
+    return (
+        fall_marketing_spend,
+        fall_students_remaining,
+        fall_students,
+        net_revenue,
+        alumni_count,
+        awareness,
+        preference,
+    )
+
+
+@_jit
+def _simulate(cost_per_credit, num_years, cfg):
+    """Per-year arrays, one per BatchResult field and in the same order."""
+    fall_marketing_spend_out = np.empty(num_years)
+    fall_students_remaining_out = np.empty(num_years)
+    enrolled_out = np.empty(num_years)
+    net_revenue_out = np.empty(num_years)
+    alumni_out = np.empty(num_years)
+    awareness_out = np.empty(num_years)
+    preference_out = np.empty(num_years)
+
+    awareness = cfg.awareness0
+    preference = cfg.preference0
+    alumni_count = cfg.alumni_count0
+    fall_marketing_spend = cfg.prior_fall_marketing_spend
+    fall_students_remaining = cfg.prior_fall_students_remaining
+    price_position = _price_position(cost_per_credit, cfg)
+
+    for year in range(num_years):
+        (
+            fall_marketing_spend,
+            fall_students_remaining,
+            fall_students,
+            net_revenue,
+            alumni_count,
+            awareness,
+            preference,
+        ) = _year(
+            year,
+            fall_marketing_spend,
+            fall_students_remaining,
+            alumni_count,
+            awareness,
+            preference,
+            cost_per_credit,
+            price_position,
+            cfg,
+        )
+        fall_marketing_spend_out[year] = fall_marketing_spend
+        fall_students_remaining_out[year] = fall_students_remaining
+        enrolled_out[year] = fall_students
+        net_revenue_out[year] = net_revenue
+        alumni_out[year] = alumni_count
+        awareness_out[year] = awareness
+        preference_out[year] = preference
+
+    return (
+        fall_marketing_spend_out,
+        fall_students_remaining_out,
+        enrolled_out,
+        net_revenue_out,
+        alumni_out,
+        awareness_out,
+        preference_out,
+    )
+
+
+@_jit
+def _final_net_revenue(cost_per_credit, num_years, cfg):
+    """_simulate's last net revenue, carrying the state in scalars, not arrays."""
+    awareness = cfg.awareness0
+    preference = cfg.preference0
+    alumni_count = cfg.alumni_count0
+    fall_marketing_spend = cfg.prior_fall_marketing_spend
+    fall_students_remaining = cfg.prior_fall_students_remaining
+    price_position = _price_position(cost_per_credit, cfg)
+    net_revenue = 0.0
+
+    for year in range(num_years):
+        (
+            fall_marketing_spend,
+            fall_students_remaining,
+            _,
+            net_revenue,
+            alumni_count,
+            awareness,
+            preference,
+        ) = _year(
+            year,
+            fall_marketing_spend,
+            fall_students_remaining,
+            alumni_count,
+            awareness,
+            preference,
+            cost_per_credit,
+            price_position,
+            cfg,
+        )
+    return net_revenue
+
+
+@_jit_parallel
+def _final_net_revenues(cost_per_credit, num_years, cfg):
+    revenues = np.empty(cost_per_credit.shape[0])
+    # Tuitions are independent, so each thread takes a share of them.
+    for i in prange(cost_per_credit.shape[0]):
+        revenues[i] = _final_net_revenue(cost_per_credit[i], num_years, cfg)
+    return revenues
+
+
+def run_model(
+    cost_per_credit: float, num_years: int, config: SimulationConfig
+) -> List[YearResult]:
+    """Compiled equivalent of simulation.run_model."""
+    if config.education.terms_per_year == 0:
+        raise ValueError("Education config must include at least one term.")
+    history = _simulate(float(cost_per_credit), num_years, flatten_config(config))
+    return BatchResult(*(a[:, np.newaxis] for a in history)).year_results(0)
+
+
+def final_net_revenues(
+    cost_per_credit: np.ndarray, num_years: int, config: SimulationConfig
+) -> np.ndarray:
+    """
+    Final-year net revenue for each tuition, as one compiled loop.
+
+    The loop runs on all of numba's threads (NUMBA_NUM_THREADS, by default one
+    per core), so there is no need to also split the sweep over processes.
+    """
+    if config.education.terms_per_year == 0:
+        raise ValueError("Education config must include at least one term.")
+    if num_years < 1:
+        raise ValueError("num_years must be at least 1.")
+    cost_per_credit = np.asarray(cost_per_credit, dtype=np.float64)
+    return _final_net_revenues(cost_per_credit, num_years, flatten_config(config))
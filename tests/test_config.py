@@ -0,0 +1,94 @@
+"""Config loading: parsing, validation and file handling."""
+
+import json
+
+import pytest
+
+from emba_tuition_model import config as config_module
+from emba_tuition_model.config import (
+    _DEFAULT_CONFIG_PATH,
+    SimulationConfig,
+    load_config,
+)
+
+
+@pytest.fixture
+def raw():
+    return json.loads(_DEFAULT_CONFIG_PATH.read_text())
+
+
+def test_default_config_round_trips_through_file(raw, tmp_path):
+    path = tmp_path / "config.json"
+    path.write_text(json.dumps(raw))
+    assert load_config(str(path)) == load_config()
+
+
+def test_integral_float_is_accepted_for_int(raw):
+    raw["education"]["credits_per_term"] = 3.0
+    config = SimulationConfig.from_dict(raw)
+    assert config.education.credits_per_term == 3
+    assert type(config.education.credits_per_term) is int
+
+
+@pytest.mark.parametrize(
+    "section, name, value",
+    [
+        ("initial_state", "skip_first_spring_summer", "false"),
+        ("initial_state", "skip_first_spring_summer", 0),
+        ("education", "credits_per_term", 2.7),
+        ("education", "credits_per_term", True),
+        ("education", "credits_per_term", "3"),
+        ("market", "size", True),
+        ("market", "size", "5000"),
+        ("market", "size", None),
+    ],
+)
+def test_bad_scalar_is_rejected(raw, section, name, value):
+    raw[section][name] = value
+    with pytest.raises(ValueError, match=rf"SimulationConfig\.{section}\.{name}"):
+        SimulationConfig.from_dict(raw)
+
+
+def test_unknown_field_is_rejected(raw):
+    raw["market"]["sise"] = 1
+    with pytest.raises(ValueError, match="unknown field"):
+        SimulationConfig.from_dict(raw)
+
+
+def test_missing_field_is_rejected(raw):
+    del raw["market"]["size"]
+    with pytest.raises(ValueError, match="field required"):
+        SimulationConfig.from_dict(raw)
+
+
+@pytest.fixture(params=["orjson", "json"])
+def parser(request, monkeypatch):
+    """Load configs with orjson (if installed) or the stdlib json fallback."""
+    if request.param == "orjson":
+        if config_module.orjson is None:
+            pytest.skip("orjson is not installed")
+    else:
+        monkeypatch.setattr(config_module, "orjson", None)
+    load_config.cache_clear()
+    yield request.param
+    load_config.cache_clear()
+
+
+def test_default_config_loads_with_either_parser(parser, raw):
+    assert load_config() == SimulationConfig.from_dict(raw)
+
+
+@pytest.mark.parametrize("literal", ["NaN", "Infinity", "-Infinity"])
+def test_non_finite_number_is_rejected_by_either_parser(parser, raw, tmp_path, literal):
+    text = json.dumps(raw).replace('"size": 100000', f'"size": {literal}', 1)
+    assert literal in text
+    path = tmp_path / "config.json"
+    path.write_text(text)
+    with pytest.raises(ValueError):
+        load_config(str(path))
+
+
+def test_non_finite_float_is_rejected(raw):
+    raw["market"]["size"] = float("inf")
+    with pytest.raises(ValueError, match=r"market\.size"):
+        SimulationConfig.from_dict(raw)
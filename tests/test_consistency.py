@@ -0,0 +1,95 @@
+"""
+The scalar, NumPy and numba simulations must agree exactly.
+
+The optimizer picks its winner from the batch (or numba) sweep and then
+re-reports it with run_model; revenue is a step function of tuition, so any
+disagreement between the paths can change which tuition wins.
+"""
+
+import dataclasses
+
+import numpy as np
+import pytest
+
+from emba_tuition_model import simulation_numba
+from emba_tuition_model.batch import run_model_batch
+from emba_tuition_model.config import load_config
+from emba_tuition_model.optimize import find_optimal_tuition
+from emba_tuition_model.simulation import run_model
+
+NUM_YEARS = 20
+TUITIONS = np.arange(500.0, 3001.0, 7.0)
+
+
+@pytest.fixture(params=[True, False], ids=["skip-spring", "no-skip"])
+def config(request):
+    default = load_config()
+    # Start with students and spend in flight so the first spring/summer matters.
+    initial = dataclasses.replace(
+        default.initial_state,
+        prior_fall_students_remaining=20,
+        prior_fall_marketing_spend=5000.0,
+        skip_first_spring_summer=request.param,
+    )
+    return dataclasses.replace(default, initial_state=initial)
+
+
+def test_batch_matches_run_model(config):
+    batch = run_model_batch(TUITIONS, NUM_YEARS, config)
+    for i, tuition in enumerate(TUITIONS):
+        assert batch.year_results(i) == run_model(tuition, NUM_YEARS, config)
+
+
+def test_numba_matches_run_model(config):
+    for tuition in TUITIONS[::10]:
+        expected = run_model(tuition, NUM_YEARS, config)
+        assert simulation_numba.run_model(tuition, NUM_YEARS, config) == expected
+
+
+def test_numba_sweep_matches_batch(config):
+    batch = run_model_batch(TUITIONS, NUM_YEARS, config)
+    revenues = simulation_numba.final_net_revenues(TUITIONS, NUM_YEARS, config)
+    np.testing.assert_array_equal(revenues, batch.net_revenue[-1])
+
+
+@pytest.mark.parametrize(
+    "options",
+    [
+        {"refinement_levels": 2},
+        {"backend": "numba"},
+    ],
+    ids=["refined", "numba"],
+)
+def test_search_variants_pick_same_winner(options):
+    config = load_config()
+    low, high = config.market.tuition_low, config.market.tuition_high
+    expected = find_optimal_tuition(config, NUM_YEARS, low, high)
+    result = find_optimal_tuition(config, NUM_YEARS, low, high, **options)
+    assert result.best_tuition_per_credit == expected.best_tuition_per_credit
+    assert result.final_net_revenue == expected.final_net_revenue
+    assert result.results == expected.results
+
+
+def test_numba_sweep_handles_year_counts(config):
+    for num_years in (1, 2):
+        batch = run_model_batch(TUITIONS, num_years, config)
+        revenues = simulation_numba.final_net_revenues(TUITIONS, num_years, config)
+        np.testing.assert_array_equal(revenues, batch.net_revenue[-1])
+    with pytest.raises(ValueError, match="num_years"):
+        simulation_numba.final_net_revenues(TUITIONS, 0, config)
+
+
+def test_batch_float32_is_close_to_float64(config):
+    exact = run_model_batch(TUITIONS, NUM_YEARS, config)
+    batch = run_model_batch(TUITIONS, NUM_YEARS, config, dtype="float32")
+    assert batch.net_revenue.dtype == np.float32
+    # No enrollment on this grid sits near a rounding boundary, so counts match
+    # exactly and revenues only carry float32 rounding (under $1 on ~$3M).
+    np.testing.assert_array_equal(batch.students_enrolled, exact.students_enrolled)
+    np.testing.assert_allclose(batch.net_revenue, exact.net_revenue, rtol=0, atol=1.0)
+
+
+@pytest.mark.parametrize("dtype", [np.int64, np.float16, "complex128"])
+def test_batch_rejects_other_dtypes(config, dtype):
+    with pytest.raises(ValueError, match="dtype"):
+        run_model_batch(TUITIONS, NUM_YEARS, config, dtype=dtype)
@@ -0,0 +1,136 @@
+import dataclasses
+import pickle
+
+import pytest
+
+from emba_tuition_model import optimize
+from emba_tuition_model.config import config_hash, load_config
+from emba_tuition_model.optimize import find_optimal_tuition
+
+NUM_YEARS = 5
+
+
+@pytest.fixture
+def config():
+    return load_config()
+
+
+def search(config, cache_dir):
+    low, high = config.market.tuition_low, config.market.tuition_high
+    return find_optimal_tuition(config, NUM_YEARS, low, high, cache_dir=cache_dir)
+
+
+def only_entry(cache_dir):
+    (path,) = cache_dir.iterdir()
+    return path
+
+
+def test_cache_round_trip(config, tmp_path):
+    result = search(config, str(tmp_path))
+    assert search(config, str(tmp_path)) == result
+    assert pickle.loads(only_entry(tmp_path).read_bytes()) == result
+
+
+def test_cache_version_is_part_of_key(config, tmp_path, monkeypatch):
+    search(config, str(tmp_path))
+    monkeypatch.setattr(optimize, "_CACHE_VERSION", optimize._CACHE_VERSION + 1)
+    search(config, str(tmp_path))
+    assert len(list(tmp_path.iterdir())) == 2
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [b"", b"not a pickle", pickle.dumps({"stale": True})],
+    ids=["empty", "garbage", "wrong-type"],
+)
+def test_unreadable_cache_entry_is_a_miss(config, tmp_path, payload):
+    expected = search(config, str(tmp_path))
+    only_entry(tmp_path).write_bytes(payload)
+    assert search(config, str(tmp_path)) == expected
+
+
+def test_empty_cache_dir_means_current_directory(config, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    result = search(config, "")
+    assert pickle.loads(only_entry(tmp_path).read_bytes()) == result
+
+
+def test_unwritable_cache_dir_still_returns_result(config, tmp_path):
+    blocker = tmp_path / "not-a-dir"
+    blocker.write_bytes(b"")
+    assert search(config, str(blocker / "cache")) == search(config, None)
+
+
+def test_failed_cache_write_leaves_no_temp_file(config, tmp_path, monkeypatch):
+    def fail(*args, **kwargs):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(optimize.pickle, "dump", fail)
+    assert search(config, str(tmp_path)) == search(config, None)
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_config_hash_ignores_derived_fields(config):
+    education = dataclasses.replace(config.education)
+    object.__setattr__(education, "credits_per_year", -1)
+    tweaked = dataclasses.replace(config, education=education)
+    assert config_hash(tweaked) == config_hash(config)
+
+
+def test_config_hash_tracks_inputs(config):
+    market = dataclasses.replace(config.market, size=config.market.size + 1)
+    assert config_hash(dataclasses.replace(config, market=market)) != config_hash(
+        config
+    )
+
+
+@pytest.mark.parametrize(
+    "options, message",
+    [
+        ({"method": "newton"}, "search method"),
+        ({"backend": "cuda"}, "backend"),
+        ({"method": "golden", "backend": "cuda"}, "backend"),
+        ({"refinement_levels": 0}, "refinement_levels"),
+        ({"step": 0}, "step"),
+        ({"step": -1}, "step"),
+    ],
+)
+def test_bad_search_options_are_rejected(config, options, message):
+    low, high = config.market.tuition_low, config.market.tuition_high
+    with pytest.raises(ValueError, match=message):
+        find_optimal_tuition(config, NUM_YEARS, low, high, **options)
+
+
+@pytest.mark.parametrize("peak", [0, 1, 17, 250, 498, 499])
+def test_golden_section_search_finds_unimodal_peak(peak):
+    tuitions = list(range(500))
+    evaluated = optimize._golden_section_search(lambda t: -abs(t - peak), tuitions)
+    assert max(evaluated, key=lambda item: item[1]) == (peak, 0)
+    assert len(evaluated) < 40
+
+
+def test_golden_search_matches_grid_on_default_config(config):
+    low, high = config.market.tuition_low, config.market.tuition_high
+    expected = find_optimal_tuition(config, NUM_YEARS, low, high)
+    result = find_optimal_tuition(config, NUM_YEARS, low, high, method="golden")
+    assert result == expected
+
+
+def test_numba_backend_requires_numba(config, monkeypatch):
+    from emba_tuition_model import simulation_numba
+
+    monkeypatch.setattr(simulation_numba, "NUMBA_AVAILABLE", False)
+    low, high = config.market.tuition_low, config.market.tuition_high
+    with pytest.raises(ImportError, match="numba"):
+        find_optimal_tuition(config, NUM_YEARS, low, high, backend="numba")
+
+
+@pytest.mark.parametrize("method", ["grid", "golden"])
+@pytest.mark.parametrize("backend", ["numpy", "numba"])
+def test_no_years_is_rejected(config, tmp_path, method, backend):
+    low, high = config.market.tuition_low, config.market.tuition_high
+    with pytest.raises(ValueError, match="num_years"):
+        find_optimal_tuition(
+            config, 0, low, high, method=method, backend=backend, cache_dir=tmp_path
+        )
+    assert list(tmp_path.iterdir()) == []
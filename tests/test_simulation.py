@@ -0,0 +1,131 @@
+"""Regression figures and reference checks for the scalar simulation."""
+
+import dataclasses
+
+import pytest
+
+from emba_tuition_model.config import load_config
+from emba_tuition_model.optimize import find_optimal_tuition
+from emba_tuition_model.simulation import (
+    Reputation,
+    YearResult,
+    alumni_phase,
+    education_phase,
+    enrollment_phase,
+    marketing_phase,
+    run_year,
+)
+
+
+def test_default_twenty_year_optimum():
+    # Spring/summer marketing spend is subtracted once. If a model change moves
+    # these figures, update them and bump optimize._CACHE_VERSION together.
+    config = load_config()
+    low, high = config.market.tuition_low, config.market.tuition_high
+    result = find_optimal_tuition(config, 20, low, high)
+    assert result.best_tuition_per_credit == 2084
+    assert round(result.final_net_revenue, 2) == 2701278.87
+
+
+def _year_from_phases(prior, cost_per_credit, total_tuition, config, skip):
+    """One year composed from the public phase functions, step by step."""
+    reputation = dataclasses.replace(prior.reputation)
+    net_revenue = 0.0
+
+    reputation.awareness *= 1 - config.reputation.awareness_decay_rate
+    reputation.preference *= 1 - config.reputation.preference_decay_rate
+
+    spring_students = round(prior.fall_students_remaining)
+    if skip:
+        reputation.alumni_count += spring_students
+        spring_summer_marketing_spend = 0.0
+    else:
+        edu = education_phase(
+            spring_students,
+            config.education.years[1],
+            cost_per_credit,
+            config.education,
+        )
+        reputation.alumni_count += round(edu.students_remaining)
+        net_revenue += edu.net_revenue
+        spring_summer_marketing_spend = max(
+            0.0, edu.net_revenue * config.marketing.spend_pct
+        )
+
+    alumni = alumni_phase(
+        reputation.alumni_count,
+        reputation.awareness,
+        reputation.preference,
+        config.alumni,
+        config.market,
+    )
+    reputation.awareness += alumni.awareness_boost
+    reputation.preference += alumni.preference_boost
+    net_revenue += alumni.donations
+
+    marketing_spend = prior.fall_marketing_spend + spring_summer_marketing_spend
+    marketing = marketing_phase(
+        marketing_spend,
+        reputation.awareness,
+        reputation.preference,
+        config.marketing,
+        config.market,
+    )
+    reputation.awareness += marketing.awareness_boost
+    reputation.preference += marketing.preference_boost
+
+    reputation.awareness = max(0.0, min(1.0, reputation.awareness))
+    reputation.preference = max(0.0, min(1.0, reputation.preference))
+    enrollment = enrollment_phase(
+        reputation, total_tuition, config.enrollment, config.market
+    )
+    fall_students = round(enrollment.students_enrolled)
+
+    fall_edu = education_phase(
+        fall_students, config.education.years[0], cost_per_credit, config.education
+    )
+    net_revenue += fall_edu.net_revenue
+    fall_marketing_spend = max(0.0, fall_edu.net_revenue * config.marketing.spend_pct)
+    net_revenue -= marketing_spend
+
+    return YearResult(
+        fall_marketing_spend,
+        round(fall_edu.students_remaining),
+        fall_students,
+        net_revenue,
+        reputation,
+    )
+
+
+@pytest.mark.parametrize("cost_per_credit", [500.0, 1200.0, 2084.0, 2900.0])
+@pytest.mark.parametrize("skip", [True, False], ids=["skip-spring", "no-skip"])
+def test_phase_functions_match_run_year(cost_per_credit, skip):
+    config = load_config()
+    initial = config.initial_state
+    total_tuition = cost_per_credit * config.education.credits_per_year
+    prior = YearResult(
+        5000.0,
+        20,
+        0,
+        0.0,
+        Reputation(initial.alumni_count, initial.awareness, initial.preference),
+    )
+    for year in range(10):
+        first = skip and year == 0
+        expected = _year_from_phases(
+            prior, cost_per_credit, total_tuition, config, first
+        )
+        prior = run_year(prior, cost_per_credit, total_tuition, config, first)
+        assert prior == expected
+
+
+def test_education_phase_uses_config_totals():
+    education = load_config().education
+    for semesters, totals in [
+        (education.years[0], education.fall_totals),
+        (list(education.years[1]), education.spring_summer_totals),
+    ]:
+        result = education_phase(40, semesters, 2084.0, education)
+        assert (result.net_revenue, result.students_remaining) == totals.run(40, 2084.0)
+    empty = education_phase(40, [], 2084.0, education)
+    assert (empty.net_revenue, empty.students_remaining) == (0.0, 40.0)